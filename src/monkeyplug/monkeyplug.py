@@ -2,21 +2,37 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import array
 import base64
+import collections
+import concurrent.futures
 import errno
+import functools
+import hashlib
+import itertools
 import json
 import mmguero
-import mutagen
+import multiprocessing
+import operator
 import os
 import pathlib
-import requests
+import queue
 import shutil
+import stat
 import string
+import subprocess
 import sys
+import tempfile
+import threading
 import wave
 
 from urllib.parse import urlparse
-from itertools import tee
+
+# orjson is optional, but handles the recognizer's JSON considerably faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ###################################################################################################
 CHANNELS_REPLACER = 'CHANNELS'
@@ -41,8 +57,25 @@ AUDIO_CODEC_TO_FORMAT = {
 AUDIO_DEFAULT_FORMAT = "mp3"
 AUDIO_DEFAULT_CHANNELS = 2
 AUDIO_MATCH_FORMAT = "MATCH"
-AUDIO_INTERMEDIATE_PARAMS = ["-c:a", "pcm_s16le", "-ac", "1", "-ar", "16000"]
-AUDIO_DEFAULT_WAV_FRAMES_CHUNK = 8000
+AUDIO_INTERMEDIATE_SAMPLE_RATE = 16000
+AUDIO_INTERMEDIATE_PARAMS = ["-f", "s16le", "-c:a", "pcm_s16le", "-ac", "1", "-ar", str(AUDIO_INTERMEDIATE_SAMPLE_RATE)]
+AUDIO_DEFAULT_WAV_FRAMES_CHUNK = 32000
+AUDIO_DEFAULT_WAV_READ_BLOCK_FRAMES = AUDIO_INTERMEDIATE_SAMPLE_RATE * 60
+AUDIO_DEFAULT_WAV_QUEUE_SIZE = 4
+FFMPEG_STDERR_TAIL_LINES = 1000
+FFMPEG_FILTER_SCRIPT_MIN_LENGTH = 32768
+FFMPEG_EXPR_GROUP_TERMS = 500
+# 0 lets ffmpeg decide how many threads to use (batch workers limit it to their share of the CPUs)
+FFMPEG_THREADS = 0
+OUTPUT_JSON_WORDS_PER_WRITE = 10000
+VOSK_DEFAULT_JOBS = 1
+VOSK_DEFAULT_BATCH_SIZE = 0
+VOSK_SEGMENT_SECONDS = 120
+VOSK_SEGMENT_SEARCH_SECONDS = 10
+VOSK_SEGMENT_WINDOW_SECONDS = 0.03
+VOSK_SILENCE_THRESHOLD_DBFS = -50
+VOSK_SILENCE_MIN_SECONDS = 1.0
+VOSK_SILENCE_PAD_SECONDS = 0.2
 BEEP_HERTZ_DEFAULT = 1000
 BEEP_MIX_NORMALIZE_DEFAULT = False
 BEEP_AUDIO_WEIGHT_DEFAULT = 1
@@ -53,6 +86,7 @@ MUTAGEN_METADATA_TAGS = ['encodedby', 'comment']
 MUTAGEN_METADATA_TAG_VALUE = u'monkeyplug'
 SPEECH_REC_MODE_VOSK = "vosk"
 SPEECH_REC_MODE_WHISPER = "whisper"
+SPEECH_REC_MODE_FASTER_WHISPER = "faster-whisper"
 DEFAULT_SPEECH_REC_MODE = os.getenv("MONKEYPLUG_MODE", SPEECH_REC_MODE_WHISPER)
 DEFAULT_VOSK_MODEL_DIR = os.getenv(
     "VOSK_MODEL_DIR", os.path.join(os.path.join(os.path.join(os.path.expanduser("~"), '.cache'), 'vosk'))
@@ -61,50 +95,172 @@ DEFAULT_WHISPER_MODEL_DIR = os.getenv(
     "WHISPER_MODEL_DIR", os.path.join(os.path.join(os.path.join(os.path.expanduser("~"), '.cache'), 'whisper'))
 )
 DEFAULT_WHISPER_MODEL_NAME = os.getenv("WHISPER_MODEL_NAME", "small.en")
+DEFAULT_TRANSCRIPT_CACHE_DIR = os.getenv(
+    "MONKEYPLUG_CACHE_DIR", os.path.join(os.path.join(os.path.expanduser("~"), '.cache'), 'monkeyplug')
+)
+FASTER_WHISPER_AUTO = "auto"
+FASTER_WHISPER_COMPUTE_TYPE_PREFERENCE = {
+    'cuda': ['int8_float16', 'float16', 'int8'],
+    'cpu': ['int8', 'int8_float32'],
+}
+DEFAULT_FASTER_WHISPER_DEVICE = os.getenv("MONKEYPLUG_DEVICE", FASTER_WHISPER_AUTO)
+DEFAULT_FASTER_WHISPER_COMPUTE_TYPE = os.getenv("MONKEYPLUG_COMPUTE_TYPE", FASTER_WHISPER_AUTO)
+FASTER_WHISPER_DEFAULT_BATCH_SIZE = 0
 
 ###################################################################################################
 script_name = os.path.basename(__file__)
 script_path = os.path.dirname(os.path.realpath(__file__))
 
 
-# thanks https://docs.python.org/3/library/itertools.html#recipes
-def pairwise(iterable):
-    a, b = tee(iterable)
-    next(b, None)
-    return zip(a, b)
+def jsonloads(value):
+    return orjson.loads(value) if orjson else json.loads(value)
+
+
+def jsondumps(value):
+    if orjson:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+
+SCRUB_TRANSLATE_TABLE = str.maketrans('', '', string.punctuation)
 
 
 def scrubword(value):
-    return str(value).lower().strip().translate(str.maketrans('', '', string.punctuation))
+    return str(value).lower().strip().translate(SCRUB_TRANSLATE_TABLE)
+
+
+def scrubwords(values):
+    # scrubword for a list of words, lowercasing and translating them all as one string
+    values = [str(value).strip() for value in values]
+    scrubbed = '\n'.join(values).lower().translate(SCRUB_TRANSLATE_TABLE).split('\n')
+    return scrubbed if (len(scrubbed) == len(values)) else [scrubword(value) for value in values]
+
+
+# sum of squares of each consecutive window of 16-bit mono PCM
+def WindowEnergies(pcm, windowFrames):
+    # numpy is optional, but scans PCM for quiet/silent stretches much faster than pure Python (it's
+    #   imported here rather than at the top as it's slow to import and only needed when segmenting)
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    if numpy is not None:
+        windows = len(pcm) // (2 * windowFrames)
+        samples = numpy.frombuffer(pcm, dtype='<i2', count=windows * windowFrames).astype(numpy.int64)
+        return numpy.square(samples).reshape(windows, windowFrames).sum(axis=1).tolist()
+
+    samples = array.array('h', pcm)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    result = []
+    for i in range(0, len(samples) - windowFrames + 1, windowFrames):
+        window = samples[i : i + windowFrames]
+        result.append(sum(map(operator.mul, window, window)))
+    return result
+
+
+# find the frame at the center of the lowest-energy window of 16-bit mono PCM between startFrame and endFrame
+def QuietestFrame(pcm, startFrame, endFrame, windowFrames):
+    energies = WindowEnergies(pcm[startFrame * 2 : endFrame * 2], windowFrames)
+    if not energies:
+        return endFrame
+    return startFrame + (energies.index(min(energies)) * windowFrames) + (windowFrames // 2)
+
+
+###################################################################################################
+# speech recognition models are expensive to load, so keep them around for the life of the process
+MODEL_CACHE = {}
+MODEL_CACHE_LOCK = threading.Lock()
+
+
+def GetCachedModel(key, loader):
+    with MODEL_CACHE_LOCK:
+        if key not in MODEL_CACHE:
+            MODEL_CACHE[key] = loader()
+        return MODEL_CACHE[key]
+
+
+# real paths of VOSK models whose batch model failed to load in this process (e.g. no CUDA), so later pluggers
+#   don't retry the (slow) load only to fail again
+VOSK_BATCH_MODEL_FAILURES = set()
+
+
+def PrefetchCachedModel(key, loader):
+    # GetCachedModel in the background, returning a future for the model (the thread is a daemon so that exiting
+    #   without ever needing the model, e.g. for an input that's already been cleaned, doesn't wait on the load)
+    future = concurrent.futures.Future()
+
+    def LoadModel():
+        try:
+            future.set_result(GetCachedModel(key, loader))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=LoadModel, daemon=True).start()
+    return future
+
+
+###################################################################################################
+# ffmpeg -threads option, if its thread count is limited
+def FfmpegThreadsArgs():
+    return ['-threads', str(FFMPEG_THREADS)] if FFMPEG_THREADS > 0 else []
 
 
 ###################################################################################################
 # download to file
-def DownloadToFile(url, local_filename=None, chunk_bytes=4096, debug=False):
-    tmpDownloadedFileSpec = local_filename if local_filename else os.path.basename(urlparse(url).path)
-    r = requests.get(url, stream=True, allow_redirects=True)
-    with open(tmpDownloadedFileSpec, "wb") as f:
-        for chunk in r.iter_content(chunk_size=chunk_bytes):
-            if chunk:
-                f.write(chunk)
-    fExists = os.path.isfile(tmpDownloadedFileSpec)
-    fSize = os.path.getsize(tmpDownloadedFileSpec)
+DOWNLOAD_SESSION = None
+DOWNLOAD_TIMEOUT_SECONDS = (5, 60)
+
+
+def DownloadToFile(url, local_filename=None, chunk_bytes=1024 * 1024, debug=False):
+    # imported here rather than at the top so that startup doesn't pay for it unless an input is a URL
+    global DOWNLOAD_SESSION
+    import requests
+
+    if DOWNLOAD_SESSION is None:
+        DOWNLOAD_SESSION = requests.Session()
+    if local_filename:
+        tmpDownloadedFileSpec = local_filename
+        f = open(tmpDownloadedFileSpec, "wb")
+    else:
+        # by default save to a new private file under the temporary directory (keeping the URL's extension), so that
+        #   nothing is written to the current working directory and concurrent downloads can't collide
+        fd, tmpDownloadedFileSpec = tempfile.mkstemp(suffix=os.path.splitext(urlparse(url).path)[1])
+        f = os.fdopen(fd, "wb")
+    try:
+        with f:
+            with DOWNLOAD_SESSION.get(url, stream=True, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT_SECONDS) as r:
+                r.raise_for_status()
+                # still undo any Content-Encoding, as iter_content did
+                r.raw.decode_content = True
+                shutil.copyfileobj(r.raw, f, chunk_bytes)
+    except BaseException:
+        # don't leave a partial download behind
+        os.remove(tmpDownloadedFileSpec)
+        raise
+    # the file was just written above, so it exists and a single stat gives its size
+    fSize = os.stat(tmpDownloadedFileSpec).st_size
     if debug:
         mmguero.eprint(
-            f"Download of {url} to {tmpDownloadedFileSpec} {'succeeded' if fExists else 'failed'} ({mmguero.SizeHumanFormat(fSize)})"
+            f"Download of {url} to {tmpDownloadedFileSpec} {'succeeded' if fSize > 0 else 'failed'} ({mmguero.SizeHumanFormat(fSize)})"
         )
 
-    if fExists and (fSize > 0):
+    if fSize > 0:
         return tmpDownloadedFileSpec
     else:
-        if fExists:
-            os.remove(tmpDownloadedFileSpec)
+        os.remove(tmpDownloadedFileSpec)
         return None
 
 
 ###################################################################################################
 # Get tag from file to indicate monkeyplug has already been set
 def GetMonkeyplugTagged(local_filename, debug=False):
+    import mutagen
+
     result = False
     if os.path.isfile(local_filename):
         mut = mutagen.File(local_filename, easy=True)
@@ -125,6 +281,8 @@ def GetMonkeyplugTagged(local_filename, debug=False):
 ###################################################################################################
 # Set tag to file to indicate monkeyplug has worked its magic
 def SetMonkeyplugTag(local_filename, debug=False):
+    import mutagen
+
     result = False
     if os.path.isfile(local_filename):
         mut = mutagen.File(local_filename, easy=True)
@@ -154,39 +312,46 @@ def SetMonkeyplugTag(local_filename, debug=False):
 ###################################################################################################
 # get stream codecs from an input filename
 # e.g. result: {'video': {'h264'}, 'audio': {'eac3'}, 'subtitle': {'subrip'}}
-def GetCodecs(local_filename, debug=False):
+def GetCodecs(local_filename, debug=False, fStat=None):
     result = {}
-    if os.path.isfile(local_filename):
-        ffprobeCmd = [
-            'ffprobe',
-            '-v',
-            'quiet',
-            '-print_format',
-            'json',
-            '-show_format',
-            '-show_streams',
-            local_filename,
-        ]
-        ffprobeResult, ffprobeOutput = mmguero.RunProcess(ffprobeCmd, stdout=True, stderr=False, debug=debug)
-        if ffprobeResult == 0:
-            ffprobeOutput = mmguero.LoadStrIfJson(' '.join(ffprobeOutput))
-            if 'streams' in ffprobeOutput:
-                for stream in ffprobeOutput['streams']:
-                    if 'codec_name' in stream and 'codec_type' in stream:
-                        cType = stream['codec_type'].lower()
-                        cValue = stream['codec_name'].lower()
-                        if cType in result:
-                            result[cType].add(cValue)
-                        else:
-                            result[cType] = set([cValue])
-            result['format'] = mmguero.DeepGet(ffprobeOutput, ['format', 'format_name'])
-            if isinstance(result['format'], str):
-                result['format'] = result['format'].split(',')
-        else:
-            mmguero.eprint(' '.join(mmguero.Flatten(ffprobeCmd)))
-            mmguero.eprint(ffprobeResult)
-            mmguero.eprint(ffprobeOutput)
-            raise ValueError(f"Could not analyze {local_filename}")
+    if fStat is None:
+        try:
+            fStat = os.stat(local_filename)
+        except OSError:
+            return result
+    if not stat.S_ISREG(fStat.st_mode):
+        return result
+
+    ffprobeCmd = [
+        'ffprobe',
+        '-v',
+        'quiet',
+        '-print_format',
+        'json',
+        '-show_entries',
+        'stream=codec_type,codec_name:format=format_name',
+        local_filename,
+    ]
+    ffprobeResult, ffprobeOutput = mmguero.RunProcess(ffprobeCmd, stdout=True, stderr=False, debug=debug)
+    if ffprobeResult == 0:
+        ffprobeOutput = mmguero.LoadStrIfJson(' '.join(ffprobeOutput))
+        if 'streams' in ffprobeOutput:
+            for stream in ffprobeOutput['streams']:
+                if 'codec_name' in stream and 'codec_type' in stream:
+                    cType = stream['codec_type'].lower()
+                    cValue = stream['codec_name'].lower()
+                    if cType in result:
+                        result[cType].add(cValue)
+                    else:
+                        result[cType] = set([cValue])
+        result['format'] = mmguero.DeepGet(ffprobeOutput, ['format', 'format_name'])
+        if isinstance(result['format'], str):
+            result['format'] = result['format'].split(',')
+    else:
+        mmguero.eprint(' '.join(ffprobeCmd))
+        mmguero.eprint(ffprobeResult)
+        mmguero.eprint(ffprobeOutput)
+        raise ValueError(f"Could not analyze {local_filename}")
 
     return result
 
@@ -195,24 +360,25 @@ def GetCodecs(local_filename, debug=False):
 class Plugger(object):
     debug = False
     inputFileSpec = ""
-    inputCodecs = {}
+    inputCodecs = None
     inputFileParts = None
+    inputStat = None
     outputFileSpec = ""
     outputAudioFileFormat = ""
     outputVideoFileFormat = ""
     outputJson = ""
     tmpDownloadedFileSpec = ""
     swearsFileSpec = ""
-    swearsMap = {}
-    wordList = []
-    naughtyWordList = []
+    swearsMap = None
+    swearsSet = frozenset()
+    wordList = None
+    naughtyWordList = None
     # for beep and mute
-    muteTimeList = []
+    muteTimeList = None
     # for beep only
-    sineTimeList = []
-    beepDelayList = []
     padSecPre = 0.0
     padSecPost = 0.0
+    mergeSec = 0.0
     beep = False
     beepHertz = BEEP_HERTZ_DEFAULT
     beepMixNormalize = BEEP_MIX_NORMALIZE_DEFAULT
@@ -220,6 +386,9 @@ class Plugger(object):
     beepSineWeight = BEEP_SINE_WEIGHT_DEFAULT
     beepDropTransition = BEEP_DROPOUT_TRANSITION_DEFAULT
     forceDespiteTag = False
+    alreadyTagged = False
+    copyIfClean = False
+    transcriptCacheDir = None
     aParams = None
     tags = None
 
@@ -235,17 +404,26 @@ class Plugger(object):
         aChannels=AUDIO_DEFAULT_CHANNELS,
         padMsecPre=0,
         padMsecPost=0,
+        mergeMsec=0,
         beep=False,
         beepHertz=BEEP_HERTZ_DEFAULT,
         beepMixNormalize=BEEP_MIX_NORMALIZE_DEFAULT,
         beepAudioWeight=BEEP_AUDIO_WEIGHT_DEFAULT,
         beepSineWeight=BEEP_SINE_WEIGHT_DEFAULT,
         beepDropTransition=BEEP_DROPOUT_TRANSITION_DEFAULT,
+        transcriptCacheDir=None,
         force=False,
         dbug=False,
     ):
+        # mutable containers are per-instance so plugger objects in the same process never share them
+        self.inputCodecs = {}
+        self.swearsMap = {}
+        self.wordList = []
+        self.naughtyWordList = []
+        self.muteTimeList = []
         self.padSecPre = padMsecPre / 1000.0
         self.padSecPost = padMsecPost / 1000.0
+        self.mergeSec = mergeMsec / 1000.0
         self.beep = beep
         self.beepHertz = beepHertz
         self.beepMixNormalize = beepMixNormalize
@@ -253,6 +431,7 @@ class Plugger(object):
         self.beepSineWeight = beepSineWeight
         self.beepDropTransition = beepDropTransition
         self.forceDespiteTag = force
+        self.transcriptCacheDir = transcriptCacheDir
         self.debug = dbug
         self.outputJson = outputJson
 
@@ -261,25 +440,32 @@ class Plugger(object):
             self.inputFileSpec = iFileSpec
         elif iFileSpec.lower().startswith("http"):
             self.tmpDownloadedFileSpec = DownloadToFile(iFileSpec)
-            if (self.tmpDownloadedFileSpec is not None) and os.path.isfile(self.tmpDownloadedFileSpec):
+            if self.tmpDownloadedFileSpec is not None:
                 self.inputFileSpec = self.tmpDownloadedFileSpec
             else:
                 raise IOError(errno.ENOENT, os.strerror(errno.ENOENT), iFileSpec)
         else:
             raise IOError(errno.ENOENT, os.strerror(errno.ENOENT), iFileSpec)
 
-        # input file should exist locally by now
-        if os.path.isfile(self.inputFileSpec):
-            self.inputFileParts = os.path.splitext(self.inputFileSpec)
-            self.inputCodecs = GetCodecs(self.inputFileSpec)
-            inputFormat = next(
-                iter([x for x in self.inputCodecs.get('format', None) if x in AUDIO_DEFAULT_PARAMS_BY_FORMAT]), None
-            )
-        else:
-            raise IOError(errno.ENOENT, os.strerror(errno.ENOENT), self.inputFileSpec)
+        # input file exists locally by now (either it was there already or DownloadToFile saved it)
+        self.inputFileParts = os.path.splitext(self.inputFileSpec)
+        # stat the input once here for everything that needs it later
+        self.inputStat = os.stat(self.inputFileSpec)
+        # a downloaded file has a temporary name, but its cleaned output still defaults to the URL's name in the CWD
+        outputBase = (
+            (os.path.splitext(os.path.basename(urlparse(iFileSpec).path))[0] or 'download')
+            if self.tmpDownloadedFileSpec
+            else self.inputFileParts[0]
+        )
+        self.inputCodecs = GetCodecs(self.inputFileSpec, fStat=self.inputStat)
+        # check the input's tags once up front (not at all if they're to be ignored anyway)
+        self.alreadyTagged = (not self.forceDespiteTag) and GetMonkeyplugTagged(self.inputFileSpec, debug=self.debug)
+        inputFormat = next(
+            (x for x in (self.inputCodecs.get('format') or ()) if x in AUDIO_DEFAULT_PARAMS_BY_FORMAT), None
+        )
 
         # determine output file name (either specified or based on input filename)
-        self.outputFileSpec = oFileSpec if oFileSpec else self.inputFileParts[0] + "_clean"
+        self.outputFileSpec = oFileSpec if oFileSpec else outputBase + "_clean"
         if self.outputFileSpec:
             outParts = os.path.splitext(self.outputFileSpec)
             if not oAudioFileFormat:
@@ -292,7 +478,7 @@ class Plugger(object):
             elif str(inputFormat).lower() in AUDIO_DEFAULT_PARAMS_BY_FORMAT:
                 self.outputFileSpec = self.outputFileSpec + '.' + inputFormat.lower()
             else:
-                for codec in mmguero.GetIterable(self.inputCodecs.get('audio', [])):
+                for codec in self.inputCodecs.get('audio') or ():
                     if codec.lower() in AUDIO_CODEC_TO_FORMAT:
                         self.outputFileSpec = self.outputFileSpec + '.' + AUDIO_CODEC_TO_FORMAT[codec.lower()]
                         break
@@ -328,7 +514,7 @@ class Plugger(object):
         self.outputVideoFileFormat = (
             self.inputFileParts[1]
             if (
-                (len(mmguero.GetIterable(self.inputCodecs.get('video', []))) > 0)
+                (len(self.inputCodecs.get('video') or ()) > 0)
                 and (str(oAudioFileFormat).upper() == AUDIO_MATCH_FORMAT)
             )
             else ''
@@ -336,6 +522,16 @@ class Plugger(object):
         if self.outputVideoFileFormat:
             self.outputFileSpec = outParts[0] + self.outputVideoFileFormat
 
+        # if there turns out to be nothing to clean, the input may be copied as-is instead of re-encoded, but only if
+        #   the encode wouldn't have changed anything that was asked for (custom encoding parameters or channels) and
+        #   it wouldn't have dropped any subtitle or data streams
+        self.copyIfClean = (
+            (not aParams)
+            and (str(aChannels) == str(AUDIO_DEFAULT_CHANNELS))
+            and (self.inputFileParts[1].lower() == os.path.splitext(self.outputFileSpec)[1].lower())
+            and not any(cType not in ('audio', 'video', 'format') for cType in self.inputCodecs)
+        )
+
         # if output file already exists, remove as we'll be overwriting it anyway
         if os.path.isfile(self.outputFileSpec):
             if self.debug:
@@ -347,12 +543,14 @@ class Plugger(object):
             self.swearsFileSpec = iSwearsFileSpec
         else:
             raise IOError(errno.ENOENT, os.strerror(errno.ENOENT), iSwearsFileSpec)
-        lines = []
+        self.swearsMap = {}
         with open(self.swearsFileSpec) as f:
-            lines = [line.rstrip("\n") for line in f]
-        for line in lines:
-            lineMap = line.split("|")
-            self.swearsMap[scrubword(lineMap[0])] = lineMap[1] if len(lineMap) > 1 else "*****"
+            for line in f:
+                swear, sep, replacement = line.rstrip("\n").partition("|")
+                swear = scrubword(swear)
+                if swear:
+                    self.swearsMap[swear] = replacement if sep else "*****"
+        self.swearsSet = frozenset(self.swearsMap)
 
         if self.debug:
             mmguero.eprint(f'Input: {self.inputFileSpec}')
@@ -362,6 +560,7 @@ class Plugger(object):
             mmguero.eprint(f'Encode parameters: {self.aParams}')
             mmguero.eprint(f'Profanity file: {self.swearsFileSpec}')
             mmguero.eprint(f'Intermediate downloaded file: {self.tmpDownloadedFileSpec}')
+            mmguero.eprint(f'Merge muted segments less than {self.mergeSec} seconds apart')
             mmguero.eprint(f'Beep instead of mute: {self.beep}')
             if self.beep:
                 mmguero.eprint(f'Beep hertz: {self.beepHertz}')
@@ -370,6 +569,23 @@ class Plugger(object):
                 mmguero.eprint(f'Beep sine weight: {self.beepSineWeight}')
                 mmguero.eprint(f'Beep dropout transition: {self.beepDropTransition}')
             mmguero.eprint(f'Force despite tags: {self.forceDespiteTag}')
+            mmguero.eprint(f'Already tagged: {self.alreadyTagged}')
+            mmguero.eprint(f'Copy if nothing to clean: {self.copyIfClean}')
+            mmguero.eprint(f'Transcript cache: {self.transcriptCacheDir}')
+
+    ######## AppendWords #########################################################
+    def AppendWords(self, words):
+        # add recognized words (in order) to the transcript, collecting the naughty ones as we go
+        self.wordList.extend(words)
+        self.naughtyWordList.extend([word for word in words if word["scrub"] is True])
+
+    ######## FlagScrubWords ######################################################
+    def FlagScrubWords(self, words):
+        # set 'scrub' on each of a list of recognized word dicts
+        swearsSet = self.swearsSet
+        for word, scrubbed in zip(words, scrubwords([word['word'] for word in words])):
+            word['scrub'] = scrubbed in swearsSet
+        return words
 
     ######## del ##################################################################
     def __del__(self):
@@ -377,74 +593,179 @@ class Plugger(object):
         if os.path.isfile(self.tmpDownloadedFileSpec):
             os.remove(self.tmpDownloadedFileSpec)
 
+    ######## TranscriptCacheId ###################################################
+    def TranscriptCacheId(self):
+        # what (besides the input file itself) determines the transcript, overridden by each recognizer
+        return None
+
+    ######## TranscriptCacheFileSpec #############################################
+    def TranscriptCacheFileSpec(self):
+        # where the transcript of this input recognized as TranscriptCacheId describes is cached, or None
+        cacheFileSpec = None
+        cacheId = self.TranscriptCacheId()
+        # downloaded inputs are saved under a new temporary name every time, so they'd never be found in the cache
+        if self.transcriptCacheDir and cacheId and not self.tmpDownloadedFileSpec:
+            cacheKey = [
+                os.path.realpath(self.inputFileSpec),
+                self.inputStat.st_size,
+                self.inputStat.st_mtime_ns,
+            ] + cacheId
+            cacheFileSpec = os.path.join(
+                self.transcriptCacheDir, hashlib.blake2b(repr(cacheKey).encode(), digest_size=16).hexdigest() + '.json'
+            )
+        return cacheFileSpec
+
+    ######## RecognizeSpeechCached ###############################################
+    def RecognizeSpeechCached(self):
+        # RecognizeSpeech, unless this input was already transcribed the same way (the words are cached without
+        #   regard to the swears list, so they're flagged for scrubbing again when loaded)
+        cacheFileSpec = self.TranscriptCacheFileSpec()
+
+        words = None
+        if cacheFileSpec and os.path.isfile(cacheFileSpec):
+            if self.debug:
+                mmguero.eprint(f'Loading cached transcript {cacheFileSpec}')
+            # like writing it, reading the cache is best-effort: an unreadable or corrupt entry is just recognized
+            #   (and cached) again
+            try:
+                with open(cacheFileSpec, 'rb') as f:
+                    words = jsonloads(f.read())
+                if not isinstance(words, list):
+                    raise ValueError('not a list of words')
+            except (OSError, ValueError) as e:
+                mmguero.eprint(f'Unable to read transcript cache {cacheFileSpec}: {e}')
+                words = None
+
+        if words is not None:
+            self.wordList.clear()
+            self.naughtyWordList = []
+            self.AppendWords(self.FlagScrubWords(words))
+            if self.outputJson:
+                self.WriteOutputJson()
+
+        else:
+            self.RecognizeSpeech()
+            # recognition may have had to fall back to another method (e.g. VOSK batch recognition being unavailable),
+            #   so cache what was actually done
+            cacheFileSpec = self.TranscriptCacheFileSpec()
+            if cacheFileSpec:
+                # caching is best-effort: failing to write the cache (read-only directory, full disk, etc.) shouldn't
+                #   lose the transcript that was just recognized
+                tmpCacheFileSpec = None
+                try:
+                    pathlib.Path(self.transcriptCacheDir).mkdir(parents=True, exist_ok=True)
+                    # write then rename so a concurrent or interrupted run never sees a partial file
+                    with tempfile.NamedTemporaryFile(
+                        'w', dir=self.transcriptCacheDir, suffix='.tmp', delete=False
+                    ) as f:
+                        tmpCacheFileSpec = f.name
+                        self.WriteWordsJson(f)
+                    os.replace(tmpCacheFileSpec, cacheFileSpec)
+                except OSError as e:
+                    mmguero.eprint(f'Unable to write transcript cache {cacheFileSpec}: {e}')
+                    if tmpCacheFileSpec and os.path.isfile(tmpCacheFileSpec):
+                        os.remove(tmpCacheFileSpec)
+
+        return self.wordList
+
+    ######## WriteWordsJson ######################################################
+    def WriteWordsJson(self, f):
+        # write wordList to f as a JSON array a group of words at a time, so that the JSON for a long transcript is
+        #   never held in memory all at once as one string
+        f.write('[')
+        for i in range(0, len(self.wordList), OUTPUT_JSON_WORDS_PER_WRITE):
+            if i > 0:
+                f.write(',')
+            f.write(jsondumps(self.wordList[i : i + OUTPUT_JSON_WORDS_PER_WRITE])[1:-1])
+        f.write(']')
+
+    ######## WriteOutputJson #####################################################
+    def WriteOutputJson(self):
+        with open(self.outputJson, "w") as f:
+            self.WriteWordsJson(f)
+
     ######## CreateCleanMuteList #################################################
     def CreateCleanMuteList(self):
-        self.RecognizeSpeech()
+        if self.swearsSet or self.outputJson:
+            self.RecognizeSpeechCached()
+        elif self.debug:
+            # with nothing to listen for (and no transcript wanted), recognition can't find anything to clean
+            mmguero.eprint(f'No swears in {self.swearsFileSpec}, skipping speech recognition')
 
-        self.naughtyWordList = [word for word in self.wordList if word["scrub"] is True]
-        if len(self.naughtyWordList) > 0:
-            # append a dummy word at the very end so that pairwise can peek then ignore it
-            self.naughtyWordList.extend(
-                [
-                    {
-                        "conf": 1,
-                        "end": self.naughtyWordList[-1]["end"] + 2.0,
-                        "start": self.naughtyWordList[-1]["end"] + 1.0,
-                        "word": "mothaflippin",
-                        "scrub": True,
-                    }
-                ]
-            )
         if self.debug:
             mmguero.eprint(self.naughtyWordList)
 
+        # the (padded) intervals to clean in order of start time, merging any that overlap or are separated by
+        #   less than mergeSec
+        intervals = []
+        for word in sorted(self.naughtyWordList, key=lambda w: w["start"]):
+            wordStart = word["start"] - self.padSecPre
+            wordEnd = word["end"] + self.padSecPost
+            if intervals and (wordStart <= intervals[-1][1] + self.mergeSec):
+                intervals[-1][1] = max(intervals[-1][1], wordEnd)
+            else:
+                intervals.append([wordStart, wordEnd])
+
         self.muteTimeList = []
-        self.sineTimeList = []
-        self.beepDelayList = []
-        for word, wordPeek in pairwise(self.naughtyWordList):
-            wordStart = format(word["start"] - self.padSecPre, ".3f")
-            wordEnd = format(word["end"] + self.padSecPost, ".3f")
-            wordDuration = format(float(wordEnd) - float(wordStart), ".3f")
-            wordPeekStart = format(wordPeek["start"] - self.padSecPre, ".3f")
+        intervalCount = len(intervals)
+        for i, (wordStart, wordEnd) in enumerate(intervals):
+            # fade back in before the next interval (or a second after the last one)
+            wordPeekStart = intervals[i + 1][0] if (i + 1 < intervalCount) else wordEnd + 1.0
             if self.beep:
-                self.muteTimeList.append(f"volume=enable='between(t,{wordStart},{wordEnd})':volume=0")
-                self.sineTimeList.append(f"sine=f={self.beepHertz}:duration={wordDuration}")
-                self.beepDelayList.append(
-                    f"atrim=0:{wordDuration},adelay={'|'.join([str(int(float(wordStart) * 1000))] * 2)}"
-                )
+                # just the intervals, which EncodeCleanAudio combines into a single mute and a single gated beep
+                self.muteTimeList.append(f"between(t,{wordStart:.3f},{wordEnd:.3f})")
             else:
                 self.muteTimeList.append(
-                    "afade=enable='between(t," + wordStart + "," + wordEnd + ")':t=out:st=" + wordStart + ":d=5ms"
+                    f"afade=enable='between(t,{wordStart:.3f},{wordEnd:.3f})':t=out:st={wordStart:.3f}:d=5ms"
                 )
                 self.muteTimeList.append(
-                    "afade=enable='between(t," + wordEnd + "," + wordPeekStart + ")':t=in:st=" + wordEnd + ":d=5ms"
+                    f"afade=enable='between(t,{wordEnd:.3f},{wordPeekStart:.3f})':t=in:st={wordEnd:.3f}:d=5ms"
                 )
 
         if self.debug:
             mmguero.eprint(self.muteTimeList)
-            if self.beep:
-                mmguero.eprint(self.sineTimeList)
-                mmguero.eprint(self.beepDelayList)
 
         return self.muteTimeList
 
     ######## EncodeCleanAudio ####################################################
     def EncodeCleanAudio(self):
-        if (self.forceDespiteTag is True) or (GetMonkeyplugTagged(self.inputFileSpec, debug=self.debug) is False):
+        if not self.alreadyTagged:
             self.CreateCleanMuteList()
 
+            if (len(self.muteTimeList) == 0) and self.copyIfClean:
+                # nothing to clean and the output is the same kind of file as the input, so don't bother re-encoding it
+                if self.debug:
+                    mmguero.eprint(f'Nothing to clean, copying {self.inputFileSpec} to {self.outputFileSpec}')
+                shutil.copyfile(self.inputFileSpec, self.outputFileSpec)
+                SetMonkeyplugTag(self.outputFileSpec, debug=self.debug)
+                return self.outputFileSpec
+
+            filterScriptFileSpec = None
             if len(self.muteTimeList) > 0:
                 if self.beep:
-                    muteTimeListStr = ','.join(self.muteTimeList)
-                    sineTimeListStr = ';'.join([f'{val}[beep{i+1}]' for i, val in enumerate(self.sineTimeList)])
-                    beepDelayList = ';'.join(
-                        [f'[beep{i+1}]{val}[beep{i+1}_delayed]' for i, val in enumerate(self.beepDelayList)]
-                    )
-                    beepMixList = ''.join([f'[beep{i+1}_delayed]' for i in range(len(self.beepDelayList))])
-                    filterStr = f"[0:a]{muteTimeListStr}[mute];{sineTimeListStr};{beepDelayList};[mute]{beepMixList}amix=inputs={len(self.beepDelayList)+1}:normalize={str(self.beepMixNormalize).lower()}:dropout_transition={self.beepDropTransition}:weights={self.beepAudioWeight} {' '.join([str(self.beepSineWeight)] * len(self.beepDelayList))}"
+                    # mute the audio during the intervals, and mix in one continuous tone which is silenced outside of them
+                    muteIntervals = '+'.join(self.muteTimeList)
+                    if len(self.muteTimeList) > FFMPEG_EXPR_GROUP_TERMS:
+                        # ffmpeg parses a chain of sums into a tree as deep as it is long, so for a lot of words sum
+                        #   parenthesized groups of terms instead to keep that shallow
+                        muteIntervals = '+'.join(
+                            f"({'+'.join(self.muteTimeList[i : i + FFMPEG_EXPR_GROUP_TERMS])})"
+                            for i in range(0, len(self.muteTimeList), FFMPEG_EXPR_GROUP_TERMS)
+                        )
+                    filterStr = f"[0:a]volume=enable='{muteIntervals}':volume=0[mute];sine=f={self.beepHertz},volume=enable='not({muteIntervals})':volume=0[beep];[mute][beep]amix=inputs=2:duration=first:normalize={str(self.beepMixNormalize).lower()}:dropout_transition={self.beepDropTransition}:weights={self.beepAudioWeight} {self.beepSineWeight}"
                     audioArgs = ['-filter_complex', filterStr]
+                    filterScriptArg = '-filter_complex_script'
                 else:
-                    audioArgs = ['-af', ",".join(self.muteTimeList)]
+                    filterStr = ",".join(self.muteTimeList)
+                    audioArgs = ['-af', filterStr]
+                    filterScriptArg = '-filter_script:a'
+                if len(filterStr) >= FFMPEG_FILTER_SCRIPT_MIN_LENGTH:
+                    # a filter for a lot of words can be longer than the OS allows a single argument to be, so pass
+                    #   those to ffmpeg in a file instead
+                    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+                        f.write(filterStr)
+                        filterScriptFileSpec = f.name
+                    audioArgs = [filterScriptArg, filterScriptFileSpec]
             else:
                 audioArgs = []
 
@@ -458,14 +779,16 @@ class Plugger(object):
                     '-loglevel',
                     'error',
                     '-y',
+                    *FfmpegThreadsArgs(),
                     '-i',
                     self.inputFileSpec,
                     '-c:v',
                     'copy',
                     '-sn',
                     '-dn',
-                    audioArgs,
-                    self.aParams,
+                    *audioArgs,
+                    *self.aParams,
+                    *FfmpegThreadsArgs(),
                     self.outputFileSpec,
                 ]
 
@@ -478,18 +801,24 @@ class Plugger(object):
                     '-loglevel',
                     'error',
                     '-y',
+                    *FfmpegThreadsArgs(),
                     '-i',
                     self.inputFileSpec,
                     '-vn',
                     '-sn',
                     '-dn',
-                    audioArgs,
-                    self.aParams,
+                    *audioArgs,
+                    *self.aParams,
+                    *FfmpegThreadsArgs(),
                     self.outputFileSpec,
                 ]
-            ffmpegResult, ffmpegOutput = mmguero.RunProcess(ffmpegCmd, stdout=True, stderr=True, debug=self.debug)
+            try:
+                ffmpegResult, ffmpegOutput = mmguero.RunProcess(ffmpegCmd, stdout=True, stderr=True, debug=self.debug)
+            finally:
+                if filterScriptFileSpec and os.path.isfile(filterScriptFileSpec):
+                    os.remove(filterScriptFileSpec)
             if (ffmpegResult != 0) or (not os.path.isfile(self.outputFileSpec)):
-                mmguero.eprint(' '.join(mmguero.Flatten(ffmpegCmd)))
+                mmguero.eprint(' '.join(ffmpegCmd))
                 mmguero.eprint(ffmpegResult)
                 mmguero.eprint(ffmpegOutput)
                 raise ValueError(f"Could not process {self.inputFileSpec}")
@@ -507,10 +836,14 @@ class Plugger(object):
 
 #################################################################################
 class VoskPlugger(Plugger):
-    tmpWavFileSpec = ""
     modelPath = ""
     wavReadFramesChunk = AUDIO_DEFAULT_WAV_FRAMES_CHUNK
+    recognizeJobs = VOSK_DEFAULT_JOBS
+    skipSilence = False
+    batchSize = VOSK_DEFAULT_BATCH_SIZE
     vosk = None
+    modelFuture = None
+    batchRecognize = False
 
     def __init__(
         self,
@@ -523,18 +856,26 @@ class VoskPlugger(Plugger):
         aParams=None,
         aChannels=AUDIO_DEFAULT_CHANNELS,
         wChunk=AUDIO_DEFAULT_WAV_FRAMES_CHUNK,
+        recognizeJobs=VOSK_DEFAULT_JOBS,
+        skipSilence=False,
+        batchSize=VOSK_DEFAULT_BATCH_SIZE,
         padMsecPre=0,
         padMsecPost=0,
+        mergeMsec=0,
         beep=False,
         beepHertz=BEEP_HERTZ_DEFAULT,
         beepMixNormalize=BEEP_MIX_NORMALIZE_DEFAULT,
         beepAudioWeight=BEEP_AUDIO_WEIGHT_DEFAULT,
         beepSineWeight=BEEP_SINE_WEIGHT_DEFAULT,
         beepDropTransition=BEEP_DROPOUT_TRANSITION_DEFAULT,
+        transcriptCacheDir=None,
         force=False,
         dbug=False,
     ):
         self.wavReadFramesChunk = wChunk
+        self.recognizeJobs = max(1, int(recognizeJobs))
+        self.skipSilence = skipSilence
+        self.batchSize = max(0, int(batchSize))
 
         # make sure the VOSK model path exists
         if (mDir is not None) and os.path.isdir(mDir):
@@ -549,9 +890,16 @@ class VoskPlugger(Plugger):
         self.vosk = mmguero.DoDynamicImport("vosk", "vosk", debug=dbug)
         if not self.vosk:
             raise Exception(f"Unable to initialize VOSK API")
-        if not dbug:
-            self.vosk.SetLogLevel(-1)
-
+        # batch recognition is used if it was asked for and is available, otherwise fall back to KaldiRecognizer
+        self.batchRecognize = (
+            (self.batchSize > 0)
+            and hasattr(self.vosk, 'BatchModel')
+            and (os.path.realpath(self.modelPath) not in VOSK_BATCH_MODEL_FAILURES)
+        )
+        if (self.batchSize > 0) and not hasattr(self.vosk, 'BatchModel'):
+            mmguero.eprint('The installed VOSK API does not support batch recognition, using KaldiRecognizer')
+        # set Kaldi's log level before the (slow, chatty) model load
+        self.vosk.SetLogLevel(0 if dbug else -1)
         super().__init__(
             iFileSpec=iFileSpec,
             oFileSpec=oFileSpec,
@@ -562,30 +910,94 @@ class VoskPlugger(Plugger):
             aChannels=aChannels,
             padMsecPre=padMsecPre,
             padMsecPost=padMsecPost,
+            mergeMsec=mergeMsec,
             beep=beep,
             beepHertz=beepHertz,
             beepMixNormalize=beepMixNormalize,
             beepAudioWeight=beepAudioWeight,
             beepSineWeight=beepSineWeight,
             beepDropTransition=beepDropTransition,
+            transcriptCacheDir=transcriptCacheDir,
             force=force,
             dbug=dbug,
         )
 
-        self.tmpWavFileSpec = self.inputFileParts[0] + ".wav"
-
         if self.debug:
             mmguero.eprint(f'Model directory: {self.modelPath}')
-            mmguero.eprint(f'Intermediate audio file: {self.tmpWavFileSpec}')
             mmguero.eprint(f'Read frames: {self.wavReadFramesChunk}')
+            mmguero.eprint(f'Recognizer jobs: {self.recognizeJobs}')
+            mmguero.eprint(f'Skip silence: {self.skipSilence}')
+            mmguero.eprint(f'Batch size: {self.batchSize}')
+            mmguero.eprint(f'Recognizer: {"BatchRecognizer" if self.batchRecognize else "KaldiRecognizer"}')
+
+        # start loading the model in the background now if speech will actually need recognizing (i.e., the input
+        #   isn't already tagged, there's something to listen for or a transcript was asked for, and the transcript
+        #   isn't cached), so that it overlaps with starting to decode the input
+        cacheFileSpec = self.TranscriptCacheFileSpec()
+        if (
+            (not self.alreadyTagged)
+            and (self.swearsSet or self.outputJson)
+            and not (cacheFileSpec and os.path.isfile(cacheFileSpec))
+        ):
+            self.modelFuture = self.PreloadModel(self.modelPath, batch=self.batchRecognize, vosk=self.vosk)
 
     def __del__(self):
         super().__del__()
-        # clean up intermediate WAV file used for speech recognition
-        if os.path.isfile(self.tmpWavFileSpec):
-            os.remove(self.tmpWavFileSpec)
 
-    def CreateIntermediateWAV(self):
+    @classmethod
+    def PreloadModel(cls, mDir, batch=False, vosk=None, dbug=False):
+        # start loading the VOSK (batch) model in mDir into the per-process model cache in the background, returning
+        #   a future for it; models are cached by their real path, so every VoskPlugger using the same model in this
+        #   process (including one created after calling this directly) shares a single load
+        if vosk is None:
+            vosk = mmguero.DoDynamicImport("vosk", "vosk", debug=dbug)
+            if not vosk:
+                raise Exception(f"Unable to initialize VOSK API")
+        modelPath = os.path.realpath(mDir)
+
+        def LoadBatchModel():
+            if hasattr(vosk, 'GpuInit'):
+                vosk.GpuInit()
+            return vosk.BatchModel(modelPath)
+
+        if batch:
+            return PrefetchCachedModel((SPEECH_REC_MODE_VOSK, modelPath, 'batch'), LoadBatchModel)
+        else:
+            return PrefetchCachedModel((SPEECH_REC_MODE_VOSK, modelPath), lambda: vosk.Model(modelPath))
+
+    def TranscriptCacheId(self):
+        return [
+            SPEECH_REC_MODE_VOSK,
+            os.path.realpath(self.modelPath),
+            (self.recognizeJobs > 1) or self.skipSilence or (self.batchSize > 0),
+            self.skipSilence,
+            self.batchRecognize,
+        ]
+
+    def OpenIntermediateWAV(self):
+        # if the input is already a WAV of 16 kHz, mono, s16 PCM, return it opened for reading
+        #   so its frames can be handed to the recognizer as they are, otherwise None
+        if ('wav' not in (self.inputCodecs.get('format') or ())) or (
+            self.inputCodecs.get('audio') != {'pcm_s16le'}
+        ):
+            return None
+        try:
+            wavIn = wave.open(self.inputFileSpec, 'rb')
+        except (wave.Error, EOFError):
+            return None
+        if (
+            (wavIn.getnchannels() == 1)
+            and (wavIn.getframerate() == AUDIO_INTERMEDIATE_SAMPLE_RATE)
+            and (wavIn.getsampwidth() == 2)
+            and (wavIn.getcomptype() == 'NONE')
+        ):
+            return wavIn
+        wavIn.close()
+        return None
+
+    def DecodeIntermediatePCM(self):
+        # decode the input to headerless PCM in the format specified by AUDIO_INTERMEDIATE_PARAMS on ffmpeg's
+        #   stdout, so decoding runs alongside recognition without writing an intermediate file
         ffmpegCmd = [
             'ffmpeg',
             '-nostdin',
@@ -594,67 +1006,249 @@ class VoskPlugger(Plugger):
             '-loglevel',
             'error',
             '-y',
+            *FfmpegThreadsArgs(),
             '-i',
             self.inputFileSpec,
             '-vn',
             '-sn',
             '-dn',
-            AUDIO_INTERMEDIATE_PARAMS,
-            self.tmpWavFileSpec,
+            *AUDIO_INTERMEDIATE_PARAMS,
+            'pipe:1',
         ]
-        ffmpegResult, ffmpegOutput = mmguero.RunProcess(ffmpegCmd, stdout=True, stderr=True, debug=self.debug)
-        if (ffmpegResult != 0) or (not os.path.isfile(self.tmpWavFileSpec)):
-            mmguero.eprint(' '.join(mmguero.Flatten(ffmpegCmd)))
-            mmguero.eprint(ffmpegResult)
-            mmguero.eprint(ffmpegOutput)
-            raise ValueError(
-                f"Could not convert {self.inputFileSpec} to {self.tmpWavFileSpec} (16 kHz, mono, s16 PCM WAV)"
-            )
+        if self.debug:
+            mmguero.eprint(' '.join(ffmpegCmd))
+        return subprocess.Popen(
+            ffmpegCmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=AUDIO_DEFAULT_WAV_READ_BLOCK_FRAMES * 2,
+        )
 
-        return self.inputFileSpec
+    def ReadFrames(self, f, dataQueue, freeQueue, readErrors):
+        # producer for RecognizeSpeech: fill buffers from freeQueue and queue them (with the number of bytes read),
+        #   then None to signal the end of the data
+        try:
+            while True:
+                buf = freeQueue.get()
+                bytesRead = f.readinto(buf)
+                if not bytesRead:
+                    break
+                dataQueue.put((buf, bytesRead))
+        except Exception as e:
+            readErrors.append(e)
+        finally:
+            dataQueue.put(None)
+
+    def QueuedBlocks(self, dataQueue, freeQueue):
+        # consumer side of ReadFrames: yield each block, recycling its buffer once the caller asks for the next one
+        while True:
+            item = dataQueue.get()
+            if item is None:
+                break
+            buf, bytesRead = item
+            yield memoryview(buf)[:bytesRead]
+            freeQueue.put(buf)
+
+    def ParseResult(self, result, offsetSec):
+        # words from a recognizer result offset by offsetSec, each flagged for scrubbing
+        words = jsonloads(result).get("result", [])
+        if offsetSec:
+            for word in words:
+                word['start'] += offsetSec
+                word['end'] += offsetSec
+        self.FlagScrubWords(words)
+        # report each utterance as it's recognized rather than the whole transcript at the end
+        if self.debug and words:
+            mmguero.eprint(jsondumps(words))
+        return words
+
+    def RecognizePCM(self, model, sampleRate, blocks, offsetSec=0.0):
+        # feed blocks of 16-bit mono PCM to a new recognizer, returning recognized words offset by offsetSec
+        words = []
+        rec = self.vosk.KaldiRecognizer(model, sampleRate)
+        rec.SetWords(True)
+
+        # blocks may be much larger than a chunk, so slice those in memory for the recognizer
+        chunkBytes = self.wavReadFramesChunk * 2
+        for block in blocks:
+            blockView = memoryview(block)
+            for offset in range(0, len(blockView), chunkBytes):
+                if rec.AcceptWaveform(bytes(blockView[offset : offset + chunkBytes])):
+                    words.extend(self.ParseResult(rec.Result(), offsetSec))
+        words.extend(self.ParseResult(rec.FinalResult(), offsetSec))
+
+        return words
+
+    def SegmentPCM(self, blocks, sampleRate):
+        # regroup blocks of 16-bit mono PCM into (offsetSec, bytes) segments of roughly VOSK_SEGMENT_SECONDS,
+        #   splitting each at the quietest point near its end to avoid cutting words in half
+        segmentFrames = int(VOSK_SEGMENT_SECONDS * sampleRate)
+        searchFrames = int(VOSK_SEGMENT_SEARCH_SECONDS * sampleRate)
+        windowFrames = int(VOSK_SEGMENT_WINDOW_SECONDS * sampleRate)
+        pending = bytearray()
+        pendingStartFrame = 0
+        for block in blocks:
+            pending.extend(block)
+            while len(pending) >= segmentFrames * 2:
+                cutFrame = QuietestFrame(pending, segmentFrames - searchFrames, segmentFrames, windowFrames)
+                yield pendingStartFrame / sampleRate, bytes(pending[: cutFrame * 2])
+                del pending[: cutFrame * 2]
+                pendingStartFrame += cutFrame
+        if pending:
+            yield pendingStartFrame / sampleRate, bytes(pending)
+
+    def VoicedSegments(self, segments, sampleRate):
+        # drop runs of silence from (offsetSec, bytes) segments of 16-bit mono PCM, yielding what remains as
+        #   (offsetSec, bytes) runs (padded a bit on either side so the recognizer doesn't lose the edges of words)
+        windowFrames = int(VOSK_SEGMENT_WINDOW_SECONDS * sampleRate)
+        padWindows = int(VOSK_SILENCE_PAD_SECONDS / VOSK_SEGMENT_WINDOW_SECONDS)
+        minGapWindows = int(VOSK_SILENCE_MIN_SECONDS / VOSK_SEGMENT_WINDOW_SECONDS)
+        threshold = ((32768 * (10 ** (VOSK_SILENCE_THRESHOLD_DBFS / 20.0))) ** 2) * windowFrames
+        for offsetSec, pcm in segments:
+            voiced = [i for i, energy in enumerate(WindowEnergies(pcm, windowFrames)) if energy > threshold]
+            runs = []
+            for i in voiced:
+                if runs and ((i - runs[-1][1]) <= minGapWindows):
+                    runs[-1][1] = i
+                else:
+                    runs.append([i, i])
+            for first, last in runs:
+                startFrame = max(0, first - padWindows) * windowFrames
+                endFrame = (last + 1 + padWindows) * windowFrames
+                yield offsetSec + (startFrame / sampleRate), pcm[startFrame * 2 : endFrame * 2]
+
+    def RecognizeSegments(self, model, sampleRate, segments):
+        # recognize segments in parallel (the VOSK API releases the GIL while decoding), collecting words in order
+        words = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.recognizeJobs) as executor:
+            futures = collections.deque()
+            for offsetSec, pcm in segments:
+                futures.append(executor.submit(self.RecognizePCM, model, sampleRate, [pcm], offsetSec))
+                # bound how much audio is held in memory waiting on the recognizers
+                while len(futures) > self.recognizeJobs * 2:
+                    words.extend(futures.popleft().result())
+            while futures:
+                words.extend(futures.popleft().result())
+        return words
+
+    def RecognizeSegmentsBatched(self, model, sampleRate, segments):
+        # recognize segments batchSize at a time as the streams of a BatchModel, which decodes them together
+        #   (on the GPU if the VOSK API was built with CUDA), feeding each stream a chunk in turn and collecting
+        #   words in order
+        words = []
+        chunkBytes = self.wavReadFramesChunk * 2
+        segments = iter(segments)
+        while True:
+            batch = list(itertools.islice(segments, self.batchSize))
+            if not batch:
+                break
+            recs = [self.vosk.BatchRecognizer(model, sampleRate) for offsetSec, pcm in batch]
+            results = [[] for offsetSec, pcm in batch]
+            for offset in range(0, max(len(pcm) for offsetSec, pcm in batch) + chunkBytes, chunkBytes):
+                for rec, (offsetSec, pcm) in zip(recs, batch):
+                    if offset < len(pcm):
+                        rec.AcceptWaveform(pcm[offset : offset + chunkBytes])
+                    elif offset < len(pcm) + chunkBytes:
+                        rec.FinishStream()
+                model.Wait()
+                for rec, (offsetSec, pcm), recWords in zip(recs, batch, results):
+                    for result in iter(rec.Result, ''):
+                        recWords.extend(self.ParseResult(result, offsetSec))
+            for recWords in results:
+                words.extend(recWords)
+        return words
+
+    def RecognizeBlocks(self, blocks):
+        # recognize blocks of 16 kHz, mono, s16 PCM, appending the recognized words
+        if self.modelFuture is None:
+            self.modelFuture = self.PreloadModel(self.modelPath, batch=self.batchRecognize, vosk=self.vosk)
+        try:
+            model = self.modelFuture.result()
+        except Exception as e:
+            if not self.batchRecognize:
+                raise
+            # e.g. the VOSK library wasn't built with CUDA
+            mmguero.eprint(f'Unable to load VOSK batch model ({e}), using KaldiRecognizer')
+            VOSK_BATCH_MODEL_FAILURES.add(os.path.realpath(self.modelPath))
+            self.batchRecognize = False
+            self.modelFuture = self.PreloadModel(self.modelPath, vosk=self.vosk)
+            model = self.modelFuture.result()
+
+        if (self.recognizeJobs > 1) or self.skipSilence or (self.batchSize > 0):
+            segments = self.SegmentPCM(blocks, AUDIO_INTERMEDIATE_SAMPLE_RATE)
+            if self.skipSilence:
+                segments = self.VoicedSegments(segments, AUDIO_INTERMEDIATE_SAMPLE_RATE)
+            if self.batchRecognize:
+                self.AppendWords(self.RecognizeSegmentsBatched(model, AUDIO_INTERMEDIATE_SAMPLE_RATE, segments))
+            else:
+                self.AppendWords(self.RecognizeSegments(model, AUDIO_INTERMEDIATE_SAMPLE_RATE, segments))
+        else:
+            self.AppendWords(self.RecognizePCM(model, AUDIO_INTERMEDIATE_SAMPLE_RATE, blocks))
+
+    def RecognizeDecodedSpeech(self):
+        # recognize the input as decoded to 16 kHz, mono, s16 PCM by ffmpeg
+        ffmpegProc = self.DecodeIntermediatePCM()
+        # drain ffmpeg's stderr as it goes so it can never fill the pipe and stall ffmpeg, keeping only the end of
+        #   it for reporting errors
+        ffmpegOutput = collections.deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+        stderrReader = threading.Thread(target=ffmpegOutput.extend, args=(ffmpegProc.stderr,), daemon=True)
+        stderrReader.start()
+        try:
+            f = ffmpegProc.stdout
+
+            # read PCM frames in a separate thread so that file I/O overlaps with decoding, reading into a small
+            #   pool of preallocated buffers which are recycled rather than allocating a new one for each block
+            blockBytes = max(self.wavReadFramesChunk, AUDIO_DEFAULT_WAV_READ_BLOCK_FRAMES) * 2
+            dataQueue = queue.Queue()
+            freeQueue = queue.Queue()
+            for i in range(AUDIO_DEFAULT_WAV_QUEUE_SIZE):
+                freeQueue.put(bytearray(blockBytes))
+            readErrors = []
+            reader = threading.Thread(target=self.ReadFrames, args=(f, dataQueue, freeQueue, readErrors), daemon=True)
+            reader.start()
+
+            self.RecognizeBlocks(self.QueuedBlocks(dataQueue, freeQueue))
+
+            reader.join()
+            if readErrors:
+                raise readErrors[0]
+
+            ffmpegResult = ffmpegProc.wait()
+            stderrReader.join()
+            if ffmpegResult != 0:
+                mmguero.eprint(ffmpegResult)
+                mmguero.eprint(b''.join(ffmpegOutput).decode(errors='replace'))
+                raise ValueError(f"Could not convert {self.inputFileSpec} to 16 kHz, mono, s16 PCM")
+
+        finally:
+            if ffmpegProc.poll() is None:
+                ffmpegProc.kill()
+            ffmpegProc.wait()
+            stderrReader.join()
+            ffmpegProc.stdout.close()
+            ffmpegProc.stderr.close()
 
     def RecognizeSpeech(self):
-        self.CreateIntermediateWAV()
         self.wordList.clear()
-        with wave.open(self.tmpWavFileSpec, "rb") as wf:
-            if (
-                (wf.getnchannels() != 1)
-                or (wf.getframerate() != 16000)
-                or (wf.getsampwidth() != 2)
-                or (wf.getcomptype() != "NONE")
-            ):
-                raise Exception(f"Audio file ({self.tmpWavFileSpec}) must be 16 kHz, mono, s16 PCM WAV")
-
-            rec = self.vosk.KaldiRecognizer(self.vosk.Model(self.modelPath), wf.getframerate())
-            rec.SetWords(True)
-            while True:
-                data = wf.readframes(self.wavReadFramesChunk)
-                if len(data) == 0:
-                    break
-                if rec.AcceptWaveform(data):
-                    res = json.loads(rec.Result())
-                    if "result" in res:
-                        self.wordList.extend(
-                            [
-                                dict(r, **{'scrub': scrubword(mmguero.DeepGet(r, ["word"])) in self.swearsMap})
-                                for r in res["result"]
-                            ]
-                        )
-            res = json.loads(rec.FinalResult())
-            if "result" in res:
-                self.wordList.extend(
-                    [
-                        dict(r, **{'scrub': scrubword(mmguero.DeepGet(r, ["word"])) in self.swearsMap})
-                        for r in res["result"]
-                    ]
-                )
+        self.naughtyWordList = []
 
+        # input that's already in the intermediate format doesn't need to be decoded by ffmpeg at all
+        wavIn = self.OpenIntermediateWAV()
+        if wavIn is not None:
             if self.debug:
-                mmguero.eprint(json.dumps(self.wordList))
+                mmguero.eprint(f'Reading 16 kHz, mono, s16 PCM directly from {self.inputFileSpec}')
+            try:
+                self.RecognizeBlocks(
+                    iter(functools.partial(wavIn.readframes, AUDIO_DEFAULT_WAV_READ_BLOCK_FRAMES), b'')
+                )
+            finally:
+                wavIn.close()
+        else:
+            self.RecognizeDecodedSpeech()
 
-            if self.outputJson:
-                with open(self.outputJson, "w") as f:
-                    f.write(json.dumps(self.wordList))
+        if self.outputJson:
+            self.WriteOutputJson()
 
         return self.wordList
 
@@ -666,6 +1260,8 @@ class VoskPlugger(Plugger):
 class WhisperPlugger(Plugger):
     debug = False
     model = None
+    modelName = None
+    modelDir = None
     whisper = None
     transcript = None
 
@@ -682,20 +1278,27 @@ class WhisperPlugger(Plugger):
         aChannels=AUDIO_DEFAULT_CHANNELS,
         padMsecPre=0,
         padMsecPost=0,
+        mergeMsec=0,
         beep=False,
         beepHertz=BEEP_HERTZ_DEFAULT,
         beepMixNormalize=BEEP_MIX_NORMALIZE_DEFAULT,
         beepAudioWeight=BEEP_AUDIO_WEIGHT_DEFAULT,
         beepSineWeight=BEEP_SINE_WEIGHT_DEFAULT,
         beepDropTransition=BEEP_DROPOUT_TRANSITION_DEFAULT,
+        transcriptCacheDir=None,
         force=False,
         dbug=False,
     ):
         self.whisper = mmguero.DoDynamicImport("whisper", "openai-whisper", debug=dbug)
         if not self.whisper:
             raise Exception("Unable to initialize Whisper API")
+        self.modelName = mName
+        self.modelDir = mDir
 
-        self.model = self.whisper.load_model(mName, download_root=mDir)
+        self.model = GetCachedModel(
+            (SPEECH_REC_MODE_WHISPER, mName, mDir),
+            lambda: self.whisper.load_model(mName, download_root=mDir),
+        )
         if not self.model:
             raise Exception(f"Unable to load Whisper model {mName} in {mDir}")
 
@@ -709,12 +1312,14 @@ class WhisperPlugger(Plugger):
             aChannels=aChannels,
             padMsecPre=padMsecPre,
             padMsecPost=padMsecPost,
+            mergeMsec=mergeMsec,
             beep=beep,
             beepHertz=beepHertz,
             beepMixNormalize=beepMixNormalize,
             beepAudioWeight=beepAudioWeight,
             beepSineWeight=beepSineWeight,
             beepDropTransition=beepDropTransition,
+            transcriptCacheDir=transcriptCacheDir,
             force=force,
             dbug=dbug,
         )
@@ -726,24 +1331,193 @@ class WhisperPlugger(Plugger):
     def __del__(self):
         super().__del__()
 
+    def TranscriptCacheId(self):
+        return [SPEECH_REC_MODE_WHISPER, self.modelName, os.path.realpath(self.modelDir) if self.modelDir else None]
+
     def RecognizeSpeech(self):
         self.wordList.clear()
+        self.naughtyWordList = []
 
         self.transcript = self.model.transcribe(word_timestamps=True, audio=self.inputFileSpec)
         if self.transcript and ('segments' in self.transcript):
+            words = []
             for segment in self.transcript['segments']:
                 if 'words' in segment:
                     for word in segment['words']:
                         word['word'] = word['word'].strip()
-                        word['scrub'] = scrubword(word['word']) in self.swearsMap
-                        self.wordList.append(word)
+                        words.append(word)
+            # the whole transcript is available at once, so flag it for scrubbing in one go
+            self.AppendWords(self.FlagScrubWords(words))
+            if self.debug:
+                for segment in self.transcript['segments']:
+                    if 'words' in segment:
+                        mmguero.eprint(jsondumps(segment['words']))
+
+        if self.outputJson:
+            self.WriteOutputJson()
+
+        return self.wordList
+
+
+#################################################################################
+
+
+#################################################################################
+class FasterWhisperPlugger(Plugger):
+    debug = False
+    model = None
+    modelName = None
+    modelDir = None
+    batchedModel = None
+    batchSize = FASTER_WHISPER_DEFAULT_BATCH_SIZE
+    device = None
+    computeType = None
+    fasterWhisper = None
+
+    def __init__(
+        self,
+        iFileSpec,
+        oFileSpec,
+        oAudioFileFormat,
+        iSwearsFileSpec,
+        mDir,
+        mName,
+        outputJson,
+        aParams=None,
+        aChannels=AUDIO_DEFAULT_CHANNELS,
+        padMsecPre=0,
+        padMsecPost=0,
+        mergeMsec=0,
+        beep=False,
+        beepHertz=BEEP_HERTZ_DEFAULT,
+        beepMixNormalize=BEEP_MIX_NORMALIZE_DEFAULT,
+        beepAudioWeight=BEEP_AUDIO_WEIGHT_DEFAULT,
+        beepSineWeight=BEEP_SINE_WEIGHT_DEFAULT,
+        beepDropTransition=BEEP_DROPOUT_TRANSITION_DEFAULT,
+        batchSize=FASTER_WHISPER_DEFAULT_BATCH_SIZE,
+        device=DEFAULT_FASTER_WHISPER_DEVICE,
+        computeType=DEFAULT_FASTER_WHISPER_COMPUTE_TYPE,
+        transcriptCacheDir=None,
+        force=False,
+        dbug=False,
+    ):
+        self.fasterWhisper = mmguero.DoDynamicImport("faster_whisper", "faster-whisper", debug=dbug)
+        if not self.fasterWhisper:
+            raise Exception("Unable to initialize Faster-Whisper API")
+        self.modelName = mName
+        self.modelDir = mDir
+
+        # pick the device and the fastest reduced-precision compute type it supports, unless told otherwise
+        ctranslate2 = mmguero.DoDynamicImport("ctranslate2", "ctranslate2", debug=dbug)
+        if (not device) or (device == FASTER_WHISPER_AUTO):
+            device = 'cuda' if ctranslate2.get_cuda_device_count() > 0 else 'cpu'
+        if (not computeType) or (computeType == FASTER_WHISPER_AUTO):
+            supported = ctranslate2.get_supported_compute_types(device)
+            computeType = next(
+                (c for c in FASTER_WHISPER_COMPUTE_TYPE_PREFERENCE.get(device, []) if c in supported),
+                'default',
+            )
+        self.device = device
+        self.computeType = computeType
+
+        self.model = GetCachedModel(
+            (SPEECH_REC_MODE_FASTER_WHISPER, mName, mDir, self.device, self.computeType),
+            lambda: self.fasterWhisper.WhisperModel(
+                mName,
+                download_root=mDir,
+                device=self.device,
+                compute_type=self.computeType,
+            ),
+        )
+        if not self.model:
+            raise Exception(f"Unable to load Faster-Whisper model {mName} in {mDir}")
+
+        self.batchSize = batchSize
+        if self.batchSize > 1:
+            # the batched pipeline splits the audio into speech chunks with its own VAD
+            #   and decodes them independently, several at a time
+            self.batchedModel = self.fasterWhisper.BatchedInferencePipeline(model=self.model)
+
+        super().__init__(
+            iFileSpec=iFileSpec,
+            oFileSpec=oFileSpec,
+            oAudioFileFormat=oAudioFileFormat,
+            iSwearsFileSpec=iSwearsFileSpec,
+            outputJson=outputJson,
+            aParams=aParams,
+            aChannels=aChannels,
+            padMsecPre=padMsecPre,
+            padMsecPost=padMsecPost,
+            mergeMsec=mergeMsec,
+            beep=beep,
+            beepHertz=beepHertz,
+            beepMixNormalize=beepMixNormalize,
+            beepAudioWeight=beepAudioWeight,
+            beepSineWeight=beepSineWeight,
+            beepDropTransition=beepDropTransition,
+            transcriptCacheDir=transcriptCacheDir,
+            force=force,
+            dbug=dbug,
+        )
 
         if self.debug:
-            mmguero.eprint(json.dumps(self.wordList))
+            mmguero.eprint(f'Model directory: {mDir}')
+            mmguero.eprint(f'Model name: {mName}')
+            mmguero.eprint(f'Device: {self.device}')
+            mmguero.eprint(f'Compute type: {self.computeType}')
+            mmguero.eprint(f'Batch size: {self.batchSize}')
+
+    def __del__(self):
+        super().__del__()
+
+    def TranscriptCacheId(self):
+        return [
+            SPEECH_REC_MODE_FASTER_WHISPER,
+            self.modelName,
+            os.path.realpath(self.modelDir) if self.modelDir else None,
+            self.computeType,
+            self.batchSize > 1,
+        ]
+
+    def RecognizeSpeech(self):
+        self.wordList.clear()
+        self.naughtyWordList = []
+
+        # segments is a generator, transcription happens as it is consumed. greedy decoding
+        #   without cross-segment conditioning is much faster and word timings are all we need,
+        #   and the VAD filter keeps the decoder from running over silence
+        if self.batchedModel:
+            segments, info = self.batchedModel.transcribe(
+                self.inputFileSpec,
+                batch_size=self.batchSize,
+                word_timestamps=True,
+                beam_size=1,
+            )
+        else:
+            segments, info = self.model.transcribe(
+                self.inputFileSpec,
+                word_timestamps=True,
+                vad_filter=True,
+                beam_size=1,
+                condition_on_previous_text=False,
+            )
+        for segment in segments:
+            if segment.words:
+                words = [
+                    {
+                        'word': word.word.strip(),
+                        'start': word.start,
+                        'end': word.end,
+                        'probability': word.probability,
+                    }
+                    for word in segment.words
+                ]
+                self.AppendWords(self.FlagScrubWords(words))
+                if self.debug:
+                    mmguero.eprint(jsondumps(words))
 
         if self.outputJson:
-            with open(self.outputJson, "w") as f:
-                f.write(json.dumps(self.wordList))
+            self.WriteOutputJson()
 
         return self.wordList
 
@@ -751,6 +1525,116 @@ class WhisperPlugger(Plugger):
 #################################################################################
 
 
+###################################################################################################
+# CreatePlugger - the Plugger for a single input file given the parsed command-line arguments
+def CreatePlugger(args, inputFileSpec):
+    if args.speechRecMode == SPEECH_REC_MODE_VOSK:
+        return VoskPlugger(
+            inputFileSpec,
+            args.output,
+            args.outputFormat,
+            args.swears,
+            args.voskModelDir,
+            args.outputJson,
+            aParams=args.aParams,
+            aChannels=args.aChannels,
+            wChunk=args.voskReadFramesChunk,
+            recognizeJobs=args.voskJobs,
+            skipSilence=args.voskSkipSilence,
+            batchSize=args.voskBatchSize,
+            padMsecPre=args.padMsecPre if args.padMsecPre > 0 else args.padMsec,
+            padMsecPost=args.padMsecPost if args.padMsecPost > 0 else args.padMsec,
+            mergeMsec=args.mergeMsec,
+            beep=args.beep,
+            beepHertz=args.beepHertz,
+            beepMixNormalize=args.beepMixNormalize,
+            beepAudioWeight=args.beepAudioWeight,
+            beepSineWeight=args.beepSineWeight,
+            beepDropTransition=args.beepDropTransition,
+            transcriptCacheDir=DEFAULT_TRANSCRIPT_CACHE_DIR if args.transcriptCache else None,
+            force=args.forceDespiteTag,
+            dbug=args.debug,
+        )
+
+    elif args.speechRecMode == SPEECH_REC_MODE_WHISPER:
+        return WhisperPlugger(
+            inputFileSpec,
+            args.output,
+            args.outputFormat,
+            args.swears,
+            args.whisperModelDir,
+            args.whisperModelName,
+            args.outputJson,
+            aParams=args.aParams,
+            aChannels=args.aChannels,
+            padMsecPre=args.padMsecPre if args.padMsecPre > 0 else args.padMsec,
+            padMsecPost=args.padMsecPost if args.padMsecPost > 0 else args.padMsec,
+            mergeMsec=args.mergeMsec,
+            beep=args.beep,
+            beepHertz=args.beepHertz,
+            beepMixNormalize=args.beepMixNormalize,
+            beepAudioWeight=args.beepAudioWeight,
+            beepSineWeight=args.beepSineWeight,
+            beepDropTransition=args.beepDropTransition,
+            transcriptCacheDir=DEFAULT_TRANSCRIPT_CACHE_DIR if args.transcriptCache else None,
+            force=args.forceDespiteTag,
+            dbug=args.debug,
+        )
+
+    elif args.speechRecMode == SPEECH_REC_MODE_FASTER_WHISPER:
+        return FasterWhisperPlugger(
+            inputFileSpec,
+            args.output,
+            args.outputFormat,
+            args.swears,
+            args.whisperModelDir,
+            args.whisperModelName,
+            args.outputJson,
+            aParams=args.aParams,
+            aChannels=args.aChannels,
+            padMsecPre=args.padMsecPre if args.padMsecPre > 0 else args.padMsec,
+            padMsecPost=args.padMsecPost if args.padMsecPost > 0 else args.padMsec,
+            mergeMsec=args.mergeMsec,
+            beep=args.beep,
+            beepHertz=args.beepHertz,
+            beepMixNormalize=args.beepMixNormalize,
+            beepAudioWeight=args.beepAudioWeight,
+            beepSineWeight=args.beepSineWeight,
+            beepDropTransition=args.beepDropTransition,
+            batchSize=args.whisperBatchSize,
+            device=args.whisperDevice,
+            computeType=args.whisperComputeType,
+            transcriptCacheDir=DEFAULT_TRANSCRIPT_CACHE_DIR if args.transcriptCache else None,
+            force=args.forceDespiteTag,
+            dbug=args.debug,
+        )
+
+    else:
+        raise ValueError(f"Unsupported speech recognition engine {args.speechRecMode}")
+
+
+###################################################################################################
+# InitPlugWorker - pin a batch worker process to its own share of the CPUs
+def InitPlugWorker(cpuQueue):
+    global FFMPEG_THREADS
+    # cpus is empty without CPU affinity support, in which case thread counts are left to their defaults
+    cpus = cpuQueue.get()
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+        # keep the inference libraries (which aren't imported until the Plugger is created) from starting
+        #   more threads than this worker has CPUs, so workers don't oversubscribe each other
+        for threadsVar in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+            os.environ[threadsVar] = str(len(cpus))
+        # likewise for the ffmpeg processes this worker runs
+        FFMPEG_THREADS = len(cpus)
+
+
+###################################################################################################
+# PlugFile - clean a single input file (run in a batch worker process)
+def PlugFile(args, inputFileSpec):
+    return CreatePlugger(args, inputFileSpec).EncodeCleanAudio()
+
+
 ###################################################################################################
 # RunMonkeyPlug
 def RunMonkeyPlug():
@@ -777,17 +1661,18 @@ def RunMonkeyPlug():
         metavar="<string>",
         type=str,
         default=DEFAULT_SPEECH_REC_MODE,
-        help=f"Speech recognition engine ({SPEECH_REC_MODE_WHISPER}|{SPEECH_REC_MODE_VOSK}) (default: {DEFAULT_SPEECH_REC_MODE})",
+        help=f"Speech recognition engine ({SPEECH_REC_MODE_WHISPER}|{SPEECH_REC_MODE_FASTER_WHISPER}|{SPEECH_REC_MODE_VOSK}) (default: {DEFAULT_SPEECH_REC_MODE})",
     )
     parser.add_argument(
         "-i",
         "--input",
         dest="input",
         type=str,
+        nargs='+',
         default=None,
         required=True,
         metavar="<string>",
-        help="Input file (or URL)",
+        help="Input file(s) (or URL)",
     )
     parser.add_argument(
         "-o",
@@ -808,6 +1693,24 @@ def RunMonkeyPlug():
         metavar="<string>",
         help="Output file to store transcript JSON",
     )
+    parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        metavar="<int>",
+        type=int,
+        default=os.getenv("MONKEYPLUG_JOBS", 1),
+        help="Number of input files to process in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--transcript-cache",
+        dest="transcriptCache",
+        type=mmguero.str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+        metavar="true|false",
+        help=f"Reuse transcripts of previously processed, unchanged input files (in {DEFAULT_TRANSCRIPT_CACHE_DIR})",
+    )
     parser.add_argument(
         "-w",
         "--swears",
@@ -818,7 +1721,7 @@ def RunMonkeyPlug():
     parser.add_argument(
         "-a",
         "--audio-params",
-        help=f"Audio parameters for ffmpeg (default depends on output audio codec)",
+        help=f"Audio parameters for ffmpeg (default depends on output audio codec; without these, an input with nothing to clean is copied rather than re-encoded)",
         dest="aParams",
         default=None,
     )
@@ -865,6 +1768,14 @@ def RunMonkeyPlug():
         default=0,
         help=f"Milliseconds to pad after muted segments (default: 0)",
     )
+    parser.add_argument(
+        "--merge-milliseconds",
+        dest="mergeMsec",
+        metavar="<int>",
+        type=int,
+        default=0,
+        help=f"Merge muted segments separated by less than this many milliseconds (default: 0)",
+    )
     parser.add_argument(
         "-b",
         "--beep",
@@ -948,8 +1859,34 @@ def RunMonkeyPlug():
         default=os.getenv("VOSK_READ_FRAMES", AUDIO_DEFAULT_WAV_FRAMES_CHUNK),
         help=f"WAV frame chunk (default: {AUDIO_DEFAULT_WAV_FRAMES_CHUNK})",
     )
+    voskArgGroup.add_argument(
+        "--vosk-jobs",
+        dest="voskJobs",
+        metavar="<int>",
+        type=int,
+        default=os.getenv("VOSK_JOBS", VOSK_DEFAULT_JOBS),
+        help=f"Recognize long files in parallel segments split at quiet points (default: {VOSK_DEFAULT_JOBS})",
+    )
+    voskArgGroup.add_argument(
+        "--vosk-skip-silence",
+        dest="voskSkipSilence",
+        type=mmguero.str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+        metavar="true|false",
+        help=f"Skip recognition of audio quieter than {VOSK_SILENCE_THRESHOLD_DBFS} dBFS for at least {VOSK_SILENCE_MIN_SECONDS} seconds",
+    )
+    voskArgGroup.add_argument(
+        "--vosk-batch-size",
+        dest="voskBatchSize",
+        metavar="<int>",
+        type=int,
+        default=os.getenv("VOSK_BATCH_SIZE", VOSK_DEFAULT_BATCH_SIZE),
+        help=f"Recognize this many segments at once with the VOSK batch (GPU) API (default: {VOSK_DEFAULT_BATCH_SIZE}, disabled)",
+    )
 
-    whisperArgGroup = parser.add_argument_group('Whisper Options')
+    whisperArgGroup = parser.add_argument_group('Whisper and Faster-Whisper Options')
     whisperArgGroup.add_argument(
         "--whisper-model-dir",
         dest="whisperModelDir",
@@ -966,6 +1903,30 @@ def RunMonkeyPlug():
         default=DEFAULT_WHISPER_MODEL_NAME,
         help=f"Whisper model name ({DEFAULT_WHISPER_MODEL_NAME})",
     )
+    whisperArgGroup.add_argument(
+        "--whisper-batch-size",
+        dest="whisperBatchSize",
+        metavar="<int>",
+        type=int,
+        default=FASTER_WHISPER_DEFAULT_BATCH_SIZE,
+        help=f"faster-whisper: transcribe speech segments in batches of this size (default: {FASTER_WHISPER_DEFAULT_BATCH_SIZE}, unbatched)",
+    )
+    whisperArgGroup.add_argument(
+        "--whisper-device",
+        dest="whisperDevice",
+        metavar="<string>",
+        type=str,
+        default=DEFAULT_FASTER_WHISPER_DEVICE,
+        help=f"faster-whisper: device (auto|cpu|cuda) (default: {DEFAULT_FASTER_WHISPER_DEVICE})",
+    )
+    whisperArgGroup.add_argument(
+        "--whisper-compute-type",
+        dest="whisperComputeType",
+        metavar="<string>",
+        type=str,
+        default=DEFAULT_FASTER_WHISPER_COMPUTE_TYPE,
+        help=f"faster-whisper: compute type (auto|int8|int8_float16|float16|float32|...) (default: {DEFAULT_FASTER_WHISPER_COMPUTE_TYPE})",
+    )
 
     try:
         parser.error = parser.exit
@@ -982,57 +1943,45 @@ def RunMonkeyPlug():
     else:
         sys.tracebacklimit = 0
 
+    if (len(args.input) > 1) and (args.output or args.outputJson):
+        raise ValueError("--output and --output-json may only be used with a single input file")
+
     if args.speechRecMode == SPEECH_REC_MODE_VOSK:
         pathlib.Path(args.voskModelDir).mkdir(parents=True, exist_ok=True)
-        plug = VoskPlugger(
-            args.input,
-            args.output,
-            args.outputFormat,
-            args.swears,
-            args.voskModelDir,
-            args.outputJson,
-            aParams=args.aParams,
-            aChannels=args.aChannels,
-            wChunk=args.voskReadFramesChunk,
-            padMsecPre=args.padMsecPre if args.padMsecPre > 0 else args.padMsec,
-            padMsecPost=args.padMsecPost if args.padMsecPost > 0 else args.padMsec,
-            beep=args.beep,
-            beepHertz=args.beepHertz,
-            beepMixNormalize=args.beepMixNormalize,
-            beepAudioWeight=args.beepAudioWeight,
-            beepSineWeight=args.beepSineWeight,
-            beepDropTransition=args.beepDropTransition,
-            force=args.forceDespiteTag,
-            dbug=args.debug,
-        )
-
-    elif args.speechRecMode == SPEECH_REC_MODE_WHISPER:
+    elif args.speechRecMode in (SPEECH_REC_MODE_WHISPER, SPEECH_REC_MODE_FASTER_WHISPER):
         pathlib.Path(args.whisperModelDir).mkdir(parents=True, exist_ok=True)
-        plug = WhisperPlugger(
-            args.input,
-            args.output,
-            args.outputFormat,
-            args.swears,
-            args.whisperModelDir,
-            args.whisperModelName,
-            args.outputJson,
-            aParams=args.aParams,
-            aChannels=args.aChannels,
-            padMsecPre=args.padMsecPre if args.padMsecPre > 0 else args.padMsec,
-            padMsecPost=args.padMsecPost if args.padMsecPost > 0 else args.padMsec,
-            beep=args.beep,
-            beepHertz=args.beepHertz,
-            beepMixNormalize=args.beepMixNormalize,
-            beepAudioWeight=args.beepAudioWeight,
-            beepSineWeight=args.beepSineWeight,
-            beepDropTransition=args.beepDropTransition,
-            force=args.forceDespiteTag,
-            dbug=args.debug,
-        )
     else:
         raise ValueError(f"Unsupported speech recognition engine {args.speechRecMode}")
 
-    print(plug.EncodeCleanAudio())
+    jobs = max(1, min(args.jobs, len(args.input)))
+    if jobs == 1:
+        for inputFileSpec in args.input:
+            print(CreatePlugger(args, inputFileSpec).EncodeCleanAudio())
+
+    else:
+        # each worker process loads its own model, so give each a disjoint set of CPUs to run it on
+        cpuQueue = multiprocessing.Queue()
+        if hasattr(os, 'sched_getaffinity'):
+            cpus = sorted(os.sched_getaffinity(0))
+            for i in range(jobs):
+                cpuQueue.put(set(cpus[i::jobs]))
+        else:
+            for i in range(jobs):
+                cpuQueue.put(set())
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=InitPlugWorker,
+            initargs=(cpuQueue,),
+        ) as executor:
+            futures = [executor.submit(PlugFile, args, inputFileSpec) for inputFileSpec in args.input]
+            try:
+                for future in futures:
+                    print(future.result())
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
 
 
 ###################################################################################################